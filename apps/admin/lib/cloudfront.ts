@@ -30,19 +30,27 @@ export function isSignedUrlsEnabled(): boolean {
   );
 }
 
+/** Normalized private key, computed on first use / 规范化后的私钥，首次使用时计算 */
+let cachedPrivateKey: string | null = null;
+
 /**
  * Get the private key from environment variable / 从环境变量获取私钥
  *
- * Handles newline escaping from env var format.
- * 处理环境变量格式中的换行符转义。
+ * Handles newline escaping from env var format. The result is cached,
+ * since the key is fixed for the life of the process.
+ * 处理环境变量格式中的换行符转义。结果会被缓存，因为密钥在进程生命周期内不变。
  */
 function getPrivateKey(): string {
+  if (cachedPrivateKey !== null) {
+    return cachedPrivateKey;
+  }
   const key = process.env.CLOUDFRONT_PRIVATE_KEY;
   if (!key) {
     throw new Error('CLOUDFRONT_PRIVATE_KEY environment variable is not set');
   }
   // Replace escaped newlines with actual newlines / 将转义的换行符替换为实际换行符
-  return key.replace(/\\n/g, '\n');
+  cachedPrivateKey = key.replace(/\\n/g, '\n');
+  return cachedPrivateKey;
 }
 
 /**
@@ -11,8 +11,14 @@ export function isSignedUrlsEnabled(): boolean {
   );
 }
 
+// Normalized once; signing a page of assets calls this per URL
+let cachedPrivateKey: string | null = null;
+
 function getPrivateKey(): string {
-  return env.CLOUDFRONT_PRIVATE_KEY.replace(/\\n/g, '\n');
+  if (cachedPrivateKey === null) {
+    cachedPrivateKey = env.CLOUDFRONT_PRIVATE_KEY.replace(/\\n/g, '\n');
+  }
+  return cachedPrivateKey;
 }
 
 export function signCloudFrontUrl(url: string, expirySeconds?: number): string {
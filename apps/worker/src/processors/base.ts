@@ -24,6 +24,15 @@ import { uploadBase64Image } from '../s3';
 
 const logger = createLogger('processor');
 
+/**
+ * Provider slug → provider ID index for usage logging
+ * 用于使用日志记录的提供商 slug → 提供商 ID 索引
+ *
+ * Provider IDs never change for a slug, so each is looked up once per process.
+ * 提供商 ID 对于给定 slug 不会改变，因此每个进程只查询一次。
+ */
+const providerIdCache = new Map<string, string>();
+
 /**
  * Processor interface
  * 处理器接口
@@ -260,9 +269,15 @@ export abstract class BaseProcessor implements Processor {
     const modelVersion = usageData?.modelVersion as string || null;
 
     try {
-      // Lookup providerId from slug for the log entry
-      const [provider] = await db.select({ id: providers.id }).from(providers).where(eq(providers.slug, providerSlug)).limit(1);
-      const providerId = provider?.id;
+      // Lookup providerId from slug for the log entry (cached after first hit)
+      let providerId = providerIdCache.get(providerSlug);
+      if (!providerId) {
+        const [provider] = await db.select({ id: providers.id }).from(providers).where(eq(providers.slug, providerSlug)).limit(1);
+        providerId = provider?.id;
+        if (providerId) {
+          providerIdCache.set(providerSlug, providerId);
+        }
+      }
 
       if (!providerId) {
         this.logger.warn(`Provider not found for usage log: ${providerSlug}`, { taskId });
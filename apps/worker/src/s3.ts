@@ -17,6 +17,7 @@
 import { S3Client, PutObjectCommand } from '@aws-sdk/client-s3';
 import { config, getS3EnvPrefix, isAdminWorker } from './config';
 import { createLogger } from '@magiworld/utils/logger';
+import { stripDataUrlPrefix } from '@magiworld/utils/ai';
 
 const logger = createLogger('s3');
 
@@ -180,9 +181,7 @@ export async function uploadBase64Image(
   const extension = mimeType.split('/')[1] || 'png';
 
   // Remove data URL prefix if present
-  const base64 = base64Data.includes('base64,')
-    ? base64Data.split('base64,')[1]
-    : base64Data;
+  const base64 = stripDataUrlPrefix(base64Data);
 
   return uploadTaskResult(userId, taskId, base64, extension, toolSlug);
 }
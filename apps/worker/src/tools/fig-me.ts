@@ -22,6 +22,23 @@ import { createLogger } from '@magiworld/utils/logger';
 
 const logger = createLogger('tool:fig-me');
 
+/**
+ * OpenAI client instance (lazy initialized, rebuilt if the API key changes)
+ * OpenAI 客户端实例（延迟初始化，API 密钥变更时重建）
+ */
+let openaiClient: { apiKey: string | undefined; client: OpenAI } | null = null;
+
+/**
+ * Get or create OpenAI client for the given API key
+ * 获取或创建给定 API 密钥的 OpenAI 客户端
+ */
+function getOpenAIClient(apiKey: string | undefined): OpenAI {
+  if (!openaiClient || openaiClient.apiKey !== apiKey) {
+    openaiClient = { apiKey, client: new OpenAI({ apiKey }) };
+  }
+  return openaiClient.client;
+}
+
 /**
  * Base step configuration with required name field
  * 带有必需 name 字段的基础步骤配置
@@ -195,8 +212,8 @@ async function processTransformStep(ctx: ToolContext): Promise<ToolResult> {
     ? `${systemPrompt}\n\nUser request: ${userPrompt}`
     : systemPrompt;
 
-  // Initialize OpenAI client
-  const openai = new OpenAI({ apiKey: credentials.apiKey });
+  // Get OpenAI client (reused across tasks)
+  const openai = getOpenAIClient(credentials.apiKey);
 
   await job.updateProgress(15);
 
@@ -294,12 +311,12 @@ async function processTransformStep(ctx: ToolContext): Promise<ToolResult> {
   await job.updateProgress(70);
 
   // Extract image data from response.output
-  // Filter for image_generation_call outputs and get the result (base64)
-  const imageOutputs = response.output.filter(
+  // Find the first image_generation_call output and get the result (base64)
+  const imageOutput = response.output.find(
     (output: { type: string }) => output.type === 'image_generation_call'
   );
 
-  if (imageOutputs.length === 0) {
+  if (!imageOutput) {
     // Check if there's a text response (error or message)
     const textOutput = response.output.find(
       (output: { type: string }) => output.type === 'message'
@@ -311,7 +328,7 @@ async function processTransformStep(ctx: ToolContext): Promise<ToolResult> {
   }
 
   // Get the base64 image from the first image_generation_call result
-  const imageBase64 = (imageOutputs[0] as { type: string; result: string }).result;
+  const imageBase64 = (imageOutput as { type: string; result: string }).result;
 
   // Upload to S3
   const mimeType = outputFormat === 'jpeg' ? 'image/jpeg' : outputFormat === 'webp' ? 'image/webp' : 'image/png';
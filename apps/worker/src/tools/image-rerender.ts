@@ -18,9 +18,8 @@
 import { fal } from '@fal-ai/client';
 import type { ToolContext, ToolResult } from './types';
 import { getProviderCredentials } from './provider-client';
-import { uploadBase64Image } from '../s3';
+import { uploadTaskResult } from '../s3';
 import { createLogger } from '@magiworld/utils/logger';
-import { bufferToBase64 } from '@magiworld/utils/ai';
 
 const logger = createLogger('tool:image-rerender');
 
@@ -124,10 +123,9 @@ export async function processImageRerender(ctx: ToolContext): Promise<ToolResult
   }
 
   const imageBuffer = Buffer.from(await imageResponse.arrayBuffer());
-  const base64 = bufferToBase64(imageBuffer);
 
-  // Upload to S3
-  const resultUrl = await uploadBase64Image(userId, taskId, base64, 'image/png', toolSlug);
+  // Upload the downloaded bytes to S3 directly (no base64 round-trip)
+  const resultUrl = await uploadTaskResult(userId, taskId, imageBuffer, 'png', toolSlug);
   logger.debug(`Uploaded result to S3`, { taskId, resultUrl });
 
   // Update progress
@@ -20,12 +20,30 @@ import type { ToolContext, ToolResult } from './types';
 import { getProviderCredentials } from './provider-client';
 import { uploadBase64Image } from '../s3';
 import { createLogger } from '@magiworld/utils/logger';
+import { stripDataUrlPrefix } from '@magiworld/utils/ai';
 
 const logger = createLogger('tool:nanobanana');
 
 /** Gemini model ID for image generation */
 const MODEL_ID = 'gemini-2.0-flash-preview-image-generation';
 
+/**
+ * Gemini client instance (lazy initialized, rebuilt if the API key changes)
+ * Gemini 客户端实例（延迟初始化，API 密钥变更时重建）
+ */
+let genaiClient: { apiKey: string | undefined; client: GoogleGenAI } | null = null;
+
+/**
+ * Get or create Gemini client for the given API key
+ * 获取或创建给定 API 密钥的 Gemini 客户端
+ */
+function getGenAIClient(apiKey: string | undefined): GoogleGenAI {
+  if (!genaiClient || genaiClient.apiKey !== apiKey) {
+    genaiClient = { apiKey, client: new GoogleGenAI({ apiKey }) };
+  }
+  return genaiClient.client;
+}
+
 /**
  * Input parameters for nanobanana generation
  * Nanobanana生成的输入参数
@@ -74,7 +92,7 @@ export async function processNanobanana(ctx: ToolContext): Promise<ToolResult> {
   await job.updateProgress(10);
 
   // Step 2: Build request and call Gemini API
-  const client = new GoogleGenAI({ apiKey: credentials.apiKey });
+  const client = getGenAIClient(credentials.apiKey);
 
   // Build message parts
   type Part =
@@ -87,9 +105,7 @@ export async function processNanobanana(ctx: ToolContext): Promise<ToolResult> {
   if (inputImages && inputImages.length > 0) {
     for (const img of inputImages) {
       // Strip data URL prefix if present
-      const base64Data = img.base64.includes('base64,')
-        ? img.base64.split('base64,')[1]
-        : img.base64;
+      const base64Data = stripDataUrlPrefix(img.base64);
 
       parts.push({
         inlineData: {
@@ -46,6 +46,21 @@ export class ProviderNoCredentialsError extends Error {
   }
 }
 
+/**
+ * How long fetched credentials are reused before re-reading the database (1 minute)
+ * 获取的凭据在重新读取数据库前的复用时长（1 分钟）
+ *
+ * Bounds how long a key rotation or deactivation in the admin takes to reach workers.
+ * 限定管理后台中的密钥轮换或停用传递到 Worker 所需的时间。
+ */
+const CREDENTIALS_CACHE_TTL_MS = 60_000;
+
+/**
+ * Credentials cache keyed by table and provider slug
+ * 按表和提供商 slug 索引的凭据缓存
+ */
+const credentialsCache = new Map<string, { credentials: ProviderCredentials; expiresAt: number }>();
+
 /**
  * Get provider credentials from database
  * 从数据库获取提供商凭据
@@ -57,6 +72,10 @@ export class ProviderNoCredentialsError extends Error {
  * - QUEUE_PREFIX=admin → 使用 adminProviders 表
  * - 其他情况 → 使用 providers 表
  *
+ * Successful lookups are cached for CREDENTIALS_CACHE_TTL_MS so every task
+ * does not re-query the same row; errors are never cached.
+ * 成功的查询会缓存 CREDENTIALS_CACHE_TTL_MS，避免每个任务重复查询同一行；错误不会被缓存。
+ *
  * @param providerSlug - Provider slug (e.g., 'fal_ai', 'openai', 'google')
  * @returns Provider credentials including API key
  * @throws ProviderNotFoundError if provider not found or not active
@@ -64,6 +83,34 @@ export class ProviderNoCredentialsError extends Error {
  */
 export async function getProviderCredentials(providerSlug: string): Promise<ProviderCredentials> {
   const isAdmin = isAdminMode();
+  const cacheKey = `${isAdmin ? 'admin' : 'web'}:${providerSlug}`;
+
+  const cached = credentialsCache.get(cacheKey);
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.credentials;
+  }
+
+  const credentials = await fetchProviderCredentials(providerSlug, isAdmin);
+  credentialsCache.set(cacheKey, {
+    credentials,
+    expiresAt: Date.now() + CREDENTIALS_CACHE_TTL_MS,
+  });
+
+  return credentials;
+}
+
+/**
+ * Fetch provider credentials from the appropriate table
+ * 从相应的表获取提供商凭据
+ *
+ * @param providerSlug - Provider slug
+ * @param isAdmin - Whether to read from adminProviders
+ * @returns Provider credentials including API key
+ */
+async function fetchProviderCredentials(
+  providerSlug: string,
+  isAdmin: boolean
+): Promise<ProviderCredentials> {
 
   if (isAdmin) {
     // Fetch from adminProviders table
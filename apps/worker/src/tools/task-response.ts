@@ -108,7 +108,10 @@ export async function saveTaskResponse(data: TaskResponseData): Promise<string>
  * 保存前清理响应的辅助函数
  *
  * Removes base64 image data to reduce storage size.
+ * Builds the copy in a single walk instead of a JSON round-trip, so large
+ * base64 payloads are never serialized only to be discarded.
  * 删除 base64 图像数据以减少存储大小。
+ * 通过单次遍历构建副本而非 JSON 往返，避免序列化随后即被丢弃的大型 base64 数据。
  *
  * @param response - Raw response object
  * @returns Sanitized response
@@ -118,24 +121,30 @@ export function sanitizeResponse(response: unknown): unknown {
     return response;
   }
 
-  // Clone to avoid mutating original
-  const sanitized = JSON.parse(JSON.stringify(response));
-
-  // Recursively remove large base64 strings
-  const removeBase64 = (obj: Record<string, unknown>): void => {
-    for (const key of Object.keys(obj)) {
-      const value = obj[key];
-      if (typeof value === 'string' && value.length > 1000) {
-        // Check if it looks like base64
-        if (/^[A-Za-z0-9+/=]+$/.test(value.slice(0, 100))) {
-          obj[key] = `[BASE64_REMOVED:${value.length} chars]`;
+  // Recursively copy, replacing large base64 strings (original is not mutated)
+  const removeBase64 = (value: unknown): unknown => {
+    if (typeof value === 'string') {
+      // Check if it looks like base64
+      if (value.length > 1000 && /^[A-Za-z0-9+/=]+$/.test(value.slice(0, 100))) {
+        return `[BASE64_REMOVED:${value.length} chars]`;
+      }
+      return value;
+    }
+    if (Array.isArray(value)) {
+      return value.map(removeBase64);
+    }
+    if (value && typeof value === 'object' && !(value instanceof Date)) {
+      const copy: Record<string, unknown> = {};
+      for (const key of Object.keys(value)) {
+        const item = (value as Record<string, unknown>)[key];
+        if (item !== undefined && typeof item !== 'function') {
+          copy[key] = removeBase64(item);
         }
-      } else if (value && typeof value === 'object') {
-        removeBase64(value as Record<string, unknown>);
       }
+      return copy;
     }
+    return value;
   };
 
-  removeBase64(sanitized);
-  return sanitized;
+  return removeBase64(response);
 }
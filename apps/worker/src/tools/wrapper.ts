@@ -64,19 +64,36 @@ export class ToolProcessorWrapper extends BaseProcessor {
   }
 }
 
+/**
+ * Wrapper registry, one instance per tool slug
+ * 包装器注册表，每个工具 slug 一个实例
+ *
+ * Wrappers hold no per-job state, so they are built once and reused
+ * across jobs instead of being constructed for every job.
+ * 包装器不持有任务级状态，因此只构建一次并在任务间复用，而不是每个任务都重新构造。
+ */
+const wrappers = new Map<string, ToolProcessorWrapper>();
+
 /**
  * Get a tool processor wrapper for a tool slug
  * 获取工具 slug 的工具处理器包装器
  *
  * @param toolSlug - Tool slug
- * @returns ToolProcessorWrapper instance
+ * @returns ToolProcessorWrapper instance (shared per slug)
  * @throws Error if tool is not registered
  */
 export function getToolProcessorWrapper(toolSlug: string): ToolProcessorWrapper {
-  if (!isToolRegistered(toolSlug)) {
-    throw new Error(`Tool not registered: ${toolSlug}`);
+  let wrapper = wrappers.get(toolSlug);
+
+  if (!wrapper) {
+    if (!isToolRegistered(toolSlug)) {
+      throw new Error(`Tool not registered: ${toolSlug}`);
+    }
+    wrapper = new ToolProcessorWrapper(toolSlug);
+    wrappers.set(toolSlug, wrapper);
   }
-  return new ToolProcessorWrapper(toolSlug);
+
+  return wrapper;
 }
 
 /**
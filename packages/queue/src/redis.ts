@@ -54,23 +54,30 @@ export function createRedisConnection(
 
   const client = new Redis(config.url, config.options);
 
+  // Subscriber connections are opened and closed per SSE stream, so their
+  // lifecycle events are not logged; errors and reconnects still are.
+  // 订阅者连接随每个 SSE 流打开和关闭，因此不记录其生命周期事件；错误和重连仍会记录。
+  const logLifecycle = !connectionName.startsWith('subscriber:');
+
   // Add connection event handlers
-  client.on('connect', () => {
-    console.log(`[Redis:${type}:${env}:${connectionName}] Connected`);
-  });
+  if (logLifecycle) {
+    client.on('connect', () => {
+      console.log(`[Redis:${type}:${env}:${connectionName}] Connected`);
+    });
 
-  client.on('ready', () => {
-    console.log(`[Redis:${type}:${env}:${connectionName}] Ready`);
-  });
+    client.on('ready', () => {
+      console.log(`[Redis:${type}:${env}:${connectionName}] Ready`);
+    });
+
+    client.on('close', () => {
+      console.log(`[Redis:${type}:${env}:${connectionName}] Connection closed`);
+    });
+  }
 
   client.on('error', (err) => {
     console.error(`[Redis:${type}:${env}:${connectionName}] Error:`, err.message);
   });
 
-  client.on('close', () => {
-    console.log(`[Redis:${type}:${env}:${connectionName}] Connection closed`);
-  });
-
   client.on('reconnecting', () => {
     console.log(`[Redis:${type}:${env}:${connectionName}] Reconnecting...`);
   });
@@ -127,8 +127,10 @@ export class AIError extends Error {
  * ```
  */
 export function stripDataUrlPrefix(dataUrl: string): string {
-  if (dataUrl.includes('base64,')) {
-    return dataUrl.split('base64,')[1];
+  // Single scan + slice; avoids split() copying every segment of large payloads
+  const index = dataUrl.indexOf('base64,');
+  if (index !== -1) {
+    return dataUrl.slice(index + 'base64,'.length);
   }
   return dataUrl;
 }
@@ -26,6 +26,9 @@ const consoleFormat = printf(({ level, message, timestamp, module, ...metadata }
  *
  * Log levels: error, warn, info, http, verbose, debug, silly
  *
+ * Timestamping and formatting live on the transport, which only runs them
+ * after its level check, so disabled debug calls stay cheap on hot paths.
+ *
  * @example
  * ```typescript
  * import { logger } from '@magiworld/utils';
@@ -37,13 +40,11 @@ const consoleFormat = printf(({ level, message, timestamp, module, ...metadata }
  */
 export const logger = winston.createLogger({
   level: process.env.LOG_LEVEL || 'info',
-  format: combine(
-    errors({ stack: true }),
-    timestamp({ format: 'YYYY-MM-DD HH:mm:ss' })
-  ),
+  format: errors({ stack: true }),
   transports: [
     new winston.transports.Console({
       format: combine(
+        timestamp({ format: 'YYYY-MM-DD HH:mm:ss' }),
         colorize({ all: process.env.NODE_ENV !== 'production' }),
         consoleFormat
       ),